@@ -1,8 +1,50 @@
 import os
 import re
+import math
+import heapq
+import functools
+import itertools
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-import difflib
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from rapidfuzz import fuzz, process
+
+_BRACKETED_ANY_RE = re.compile(r'\[[^\]]*\]|\([^)]*\)|\{[^}]*\}')
+_YYMMDD_RE = re.compile(r'(\d{2})(\d{2})(\d{2})')
+# Hiragana, Katakana and CJK unified ideographs.
+_JP_RE = re.compile(r'[\u3040-\u30ff\u4e00-\u9fff]')
+# Keywords for the OST/fandisc detectors, compiled once into case-insensitive
+# alternations. A space in a keyword also matches other or no whitespace.
+_OST_KEYWORDS = ("ost", "soundtrack", "オリジナルサウンドトラック")
+_FANDISC_KEYWORDS = ("fandisc", "fan disc", "ファンディスク")
+_OST_KW_RE = re.compile("|".join(re.escape(kw).replace(r"\ ", r"\s?") for kw in _OST_KEYWORDS), re.IGNORECASE)
+_FANDISC_KW_RE = re.compile("|".join(re.escape(kw).replace(r"\ ", r"\s?") for kw in _FANDISC_KEYWORDS),
+                            re.IGNORECASE)
+
+# Worker counts for the candidate prefetch and the background release lookups in main().
+_PREFETCH_WORKERS = 8
+_RELEASE_WORKERS = 2
+# Folders whose candidates are fetched ahead of the one being processed. Bounded so a
+# large directory doesn't burst into VNDB's rate limit or outlive a Ctrl-C.
+_PREFETCH_AHEAD = _PREFETCH_WORKERS
+
+# (connect, read) timeouts for VNDB calls, so a stalled handshake fails fast.
+_TIMEOUT = (3.05, 10)
+
+# Shared session so consecutive VNDB calls reuse the same keep-alive connection.
+_SESSION = requests.Session()
+_SESSION.headers.update({"Content-Type": "application/json"})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=_PREFETCH_WORKERS + _RELEASE_WORKERS,
+    # VNDB queries are read-only POSTs, so they are safe to retry.
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504],
+                      allowed_methods=None, raise_on_status=False),
+))
 
 
 def parse_bracket_info(folder_name):
@@ -15,23 +57,28 @@ def parse_bracket_info(folder_name):
       - Otherwise, if the segment contains alphanumeric characters with a minimum length of 3,
         it is assumed to be the producer.
       - Pure-digit segments longer than 6 digits are ignored.
+    The first matching segment of each kind is used; scanning stops once both are found.
 
     Returns a tuple: (expected_date, expected_producer).
     """
-    matches = re.findall(r'\[(.*?)\]', folder_name)
     expected_date = ""
     expected_producer = ""
-    for segment in matches:
-        segment = segment.strip()
-        if segment.isdigit() and len(segment) == 6:
-            mm = int(segment[2:4])
-            dd = int(segment[4:6])
-            if 1 <= mm <= 12 and 1 <= dd <= 31:
+    start = folder_name.find("[")
+    while start != -1 and not (expected_date and expected_producer):
+        end = folder_name.find("]", start + 1)
+        if end == -1:
+            break
+        segment = folder_name[start + 1:end].strip()
+        date_match = _YYMMDD_RE.fullmatch(segment)
+        if date_match:
+            _, mm, dd = date_match.groups()
+            if not expected_date and 1 <= int(mm) <= 12 and 1 <= int(dd) <= 31:
                 expected_date = segment
         elif len(segment) >= 3:
             if not (segment.isdigit() and len(segment) > 6):
                 if not expected_producer:
                     expected_producer = segment
+        start = folder_name.find("[", end + 1)
     return expected_date, expected_producer
 
 
@@ -42,10 +89,7 @@ def parse_folder_name(folder_name):
 
     Returns a dictionary with the extracted title.
     """
-    cleaned = re.sub(r'\[.*?\]', '', folder_name)
-    cleaned = re.sub(r'\(.*?\)', '', cleaned)
-    cleaned = re.sub(r'\{.*?\}', '', cleaned)
-    cleaned = cleaned.strip()
+    cleaned = _BRACKETED_ANY_RE.sub('', folder_name).strip()
     if "+" in cleaned:
         parts = cleaned.split("+", 1)
         title = parts[0].strip()
@@ -53,7 +97,106 @@ def parse_folder_name(folder_name):
     return {"title": cleaned, "release": ""}
 
 
-def get_vn_candidates(search_query, expected_date="", expected_producer=""):
+@dataclass(slots=True)
+class Candidate:
+    """A scored VNDB search result with the fields used for ranking and display."""
+    raw: dict
+    title: str
+    producer: str
+    date: str
+    score: float
+
+
+def _batch_similarity(query, choices, processor=None, missing=0.5):
+    """
+    Scores query against every string in choices with a single rapidfuzz call.
+
+    Returns a list of similarities in the range 0..1, aligned with choices.
+    If the query or a choice is empty, the neutral value `missing` is used.
+    fuzz.ratio is the normalized Indel (LCS-based) similarity, not difflib's
+    Ratcliff/Obershelp ratio, so its scores are not identical to SequenceMatcher's.
+    """
+    scores = [missing] * len(choices)
+    if not query:
+        return scores
+    for _, score, idx in process.extract(query, choices, scorer=fuzz.ratio, processor=processor, limit=None):
+        if choices[idx]:
+            scores[idx] = score / 100.0
+    return scores
+
+
+@functools.lru_cache(maxsize=4096)
+def _yymmdd_ordinal(date_str):
+    """
+    Converts a YYMMDD string to a proleptic Gregorian ordinal day.
+    Returns None if the string is not a valid date.
+    """
+    try:
+        return datetime.strptime(date_str, "%y%m%d").toordinal()
+    except ValueError:
+        return None
+
+
+def _date_closeness(expected_date, candidate_date):
+    """
+    Scores how close two YYMMDD dates are, from 1.0 for the same day decaying
+    exponentially with a 90-day scale. If either date is missing or invalid,
+    a neutral value (0.5) is used.
+    """
+    if not expected_date or not candidate_date:
+        return 0.5
+    expected_day = _yymmdd_ordinal(expected_date)
+    candidate_day = _yymmdd_ordinal(candidate_date)
+    if expected_day is None or candidate_day is None:
+        return 0.5
+    return math.exp(-abs(expected_day - candidate_day) / 90)
+
+
+def _title_similarity_bound(len_a, len_b):
+    """
+    Returns the highest similarity fuzz.ratio can give two strings of the given lengths,
+    i.e. 2 * min / sum, as a value in the range 0..1.
+    """
+    total = len_a + len_b
+    return 2 * min(len_a, len_b) / total if total else 0.0
+
+
+@functools.lru_cache(maxsize=1024)
+def _vn_search_raw(search_query):
+    """
+    Posts a VN search for search_query to /kana/vn and returns the decoded JSON.
+
+    Results are memoized per query. Errors are raised rather than returned so that
+    failed lookups are not cached.
+    """
+    payload = {
+        "filters": ["search", "=", search_query],
+        "fields": "id,title,released,developers.name,olang,length"
+    }
+    response = _SESSION.post("https://api.vndb.org/kana/vn", json=payload, timeout=_TIMEOUT)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+@functools.lru_cache(maxsize=1024)
+def _release_fetch_raw(vn_id):
+    """
+    Posts a release lookup for the (already "v"-prefixed) vn_id to /kana/release and
+    returns the decoded JSON.
+
+    Results are memoized per id. Errors are raised rather than returned so that
+    failed lookups are not cached.
+    """
+    payload = {
+        "filters": ["vn", "=", ["id", "=", vn_id]],
+        "fields": "title,released,producers.name,producers.developer,official"
+    }
+    response = _SESSION.post("https://api.vndb.org/kana/release", json=payload, timeout=_TIMEOUT)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+def get_vn_candidates(search_query, expected_date="", expected_producer="", log=print):
     """
     Searches the VNDB API for visual novel entries matching the search_query.
 
@@ -61,33 +204,24 @@ def get_vn_candidates(search_query, expected_date="", expected_producer=""):
       id, title, released, developers.name, olang, length.
     For each candidate, computes a composite confidence score based on:
       - Title similarity,
-      - Similarity between the expected release date and candidate’s release date,
+      - Closeness in days between the expected release date and candidate’s release date,
       - Similarity between the expected producer and the candidate’s producer.
     If an expected value is missing, a neutral value (0.5) is used.
+    API errors are reported through log, which defaults to print.
 
-    Returns up to three tuples: (candidate_dict, composite_confidence).
+    Returns up to three Candidate records, best match first.
     """
-    url = "https://api.vndb.org/kana/vn"
-    headers = {"Content-Type": "application/json"}
-    payload = {
-        "filters": ["search", "=", search_query],
-        "fields": "id,title,released,developers.name,olang,length"
-    }
-
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=10)
-        response.raise_for_status()
-    except requests.HTTPError as http_err:
-        print(f"HTTP error during VN search for '{search_query}': {response.status_code} {response.text}")
+        data = _vn_search_raw(search_query)
+    except orjson.JSONDecodeError as err:
+        log(f"Error parsing JSON for VN search '{search_query}': {err}")
         return []
-    except Exception as err:
-        print(f"Error during VN search for '{search_query}': {err}")
+    except requests.HTTPError as http_err:
+        response = http_err.response
+        log(f"HTTP error during VN search for '{search_query}': {response.status_code} {response.text}")
         return []
-
-    try:
-        data = response.json()
     except Exception as err:
-        print(f"Error parsing JSON for VN search '{search_query}': {err}")
+        log(f"Error during VN search for '{search_query}': {err}")
         return []
 
     if "results" in data and isinstance(data["results"], list):
@@ -98,37 +232,54 @@ def get_vn_candidates(search_query, expected_date="", expected_producer=""):
     if not candidates:
         return []
 
-    candidates_with_conf = []
+    titles = []
+    dates = []
+    producers = []
     for candidate in candidates:
-        candidate_title = candidate.get("title", "")
-        title_conf = difflib.SequenceMatcher(None, search_query.lower(), candidate_title.lower()).ratio()
+        titles.append(candidate.get("title", ""))
         candidate_release = candidate.get("released", "")
-        candidate_date = format_release_date(candidate_release) if candidate_release else ""
-        if expected_date and candidate_date:
-            date_conf = difflib.SequenceMatcher(None, expected_date, candidate_date).ratio()
-        else:
-            date_conf = 0.5
+        dates.append(format_release_date(candidate_release) if candidate_release else "")
         devs = candidate.get("developers", [])
         if devs and isinstance(devs, list) and len(devs) > 0:
             candidate_dev = devs[0]
             if isinstance(candidate_dev, dict):
-                candidate_producer = candidate_dev.get("name", "")
+                producers.append(candidate_dev.get("name", ""))
             else:
-                candidate_producer = candidate_dev
+                producers.append(candidate_dev)
         else:
-            candidate_producer = ""
-        if expected_producer and candidate_producer:
-            prod_conf = difflib.SequenceMatcher(None, expected_producer.lower(), candidate_producer.lower()).ratio()
-        else:
-            prod_conf = 0.5
-        composite_conf = (title_conf + date_conf + prod_conf) / 3
-        candidates_with_conf.append((candidate, composite_conf))
+            producers.append("")
+
+    date_confs = [_date_closeness(expected_date, date) for date in dates]
+    prod_confs = _batch_similarity(expected_producer, producers, processor=str.lower)
+    partial_confs = [date_conf + prod_conf for date_conf, prod_conf in zip(date_confs, prod_confs)]
+
+    # Title similarity is the expensive term, so only score titles whose length-based
+    # upper bound could still place the candidate in the top three.
+    query_len = len(search_query.lower())
+    upper_bounds = [
+        partial_conf + _title_similarity_bound(query_len, len(title.lower()))
+        for partial_conf, title in zip(partial_confs, titles)
+    ]
+    order = sorted(range(len(candidates)), key=lambda i: upper_bounds[i], reverse=True)
+
+    title_confs = {}
 
-    candidates_with_conf.sort(key=lambda x: x[1], reverse=True)
-    return candidates_with_conf[:3]
+    def score_titles(indices):
+        scores = _batch_similarity(search_query, [titles[i] for i in indices], processor=str.lower, missing=0.0)
+        title_confs.update(zip(indices, scores))
 
+    score_titles(order[:3])
+    threshold = min(partial_confs[i] + title_confs[i] for i in order[:3])
+    score_titles([i for i in order[3:] if upper_bounds[i] >= threshold - 1e-9])
 
-def search_release(vn_id):
+    scored = [
+        Candidate(candidates[i], titles[i], producers[i], dates[i], (partial_confs[i] + title_confs[i]) / 3)
+        for i in sorted(title_confs)
+    ]
+    return heapq.nlargest(3, scored, key=lambda c: c.score)
+
+
+def search_release(vn_id, log=print):
     """
     Retrieves release information for the given VN id from VNDB.
 
@@ -136,33 +287,24 @@ def search_release(vn_id):
       title, released, producers.name, producers.developer, official.
     Uses the filter ["vn", "=", ["id", "=", vn_id]] to select releases by
     visual novel id. Checks for both "result" and "results" keys.
-    Returns the first official release if available; otherwise, the first release.
-    """
-    url = "https://api.vndb.org/kana/release"
-    headers = {"Content-Type": "application/json"}
-    vn_id = str(vn_id)
-    if not vn_id.startswith("v"):
-        vn_id = f"v{vn_id}"
-
-    payload = {
-        "filters": ["vn", "=", ["id", "=", vn_id]],
-        "fields": "title,released,producers.name,producers.developer,official"
-    }
+    Returns the first official release if available; otherwise, the first release.
+    Errors and a missing release are reported through log, which defaults to print.
+    """
+    vn_id = str(vn_id)
+    if not vn_id.startswith("v"):
+        vn_id = f"v{vn_id}"
 
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=10)
-        response.raise_for_status()
-    except requests.HTTPError as http_err:
-        print(f"HTTP error during release search for VN id '{vn_id}': {response.status_code} {response.text}")
+        data = _release_fetch_raw(vn_id)
+    except orjson.JSONDecodeError as err:
+        log(f"Error parsing JSON for release search for VN id '{vn_id}': {err}")
         return None
-    except Exception as err:
-        print(f"Error during release search for VN id '{vn_id}': {err}")
+    except requests.HTTPError as http_err:
+        response = http_err.response
+        log(f"HTTP error during release search for VN id '{vn_id}': {response.status_code} {response.text}")
         return None
-
-    try:
-        data = response.json()
     except Exception as err:
-        print(f"Error parsing JSON for release search for VN id '{vn_id}': {err}")
+        log(f"Error during release search for VN id '{vn_id}': {err}")
         return None
 
     if isinstance(data, list):
@@ -180,7 +322,7 @@ def search_release(vn_id):
         releases = []
 
     if not releases:
-        print(f"No release found for VN id: {vn_id}")
+        log(f"No release found for VN id: {vn_id}")
         return None
 
     selected_release = None
@@ -200,14 +342,13 @@ def search_tag(tag_query):
     Returns the first matching tag or None.
     """
     url = "https://api.vndb.org/kana/tag"
-    headers = {"Content-Type": "application/json"}
     payload = {
         "filters": ["search", "=", tag_query],
         "fields": "id,name,aliases,description,category,vn_count"
     }
 
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=10)
+        response = _SESSION.post(url, json=payload, timeout=_TIMEOUT)
         response.raise_for_status()
     except requests.HTTPError as http_err:
         print(f"HTTP error during tag search for '{tag_query}': {response.status_code} {response.text}")
@@ -217,7 +358,7 @@ def search_tag(tag_query):
         return None
 
     try:
-        data = response.json()
+        data = orjson.loads(response.content)
     except Exception as err:
         print(f"Error parsing JSON for tag search '{tag_query}': {err}")
         return None
@@ -242,19 +383,41 @@ def search_tag(tag_query):
     return tags[0]
 
 
+@functools.lru_cache(maxsize=4096)
 def format_release_date(release_date_str):
     """
     Formats a release date string (expected in YYYY-MM-DD) as YYMMDD.
     Returns "Unknown" if parsing fails.
+
+    Well-formed YYYY-MM-DD strings are sliced directly; anything else goes
+    through datetime.strptime. Results are memoized.
     """
     try:
-        dt = datetime.strptime(release_date_str, "%Y-%m-%d")
+        s = release_date_str
+        if (len(s) == 10 and s[4] == "-" and s[7] == "-"
+                and s[:4].isdigit() and s[5:7].isdigit() and s[8:].isdigit()):
+            return s[2:4] + s[5:7] + s[8:]
+        dt = datetime.strptime(s, "%Y-%m-%d")
         return dt.strftime("%y%m%d")
     except Exception:
         return "Unknown"
 
 
-def detect_ost(folder_path, folder_name, release_info=None):
+def list_folder_entries(folder_path):
+    """
+    Returns the names of all entries in folder_path using a single os.scandir pass,
+    so the result can be shared between the OST and fandisc detectors.
+    Returns an empty list if the folder cannot be read.
+    """
+    try:
+        with os.scandir(folder_path) as it:
+            return [entry.name for entry in it]
+    except Exception as e:
+        print("Error accessing files in folder:", e)
+        return []
+
+
+def detect_ost(folder_path, folder_name, release_info=None, file_names=None):
     """
     Automatically detects if an OST is included by checking for keywords:
       "ost", "soundtrack", or "オリジナルサウンドトラック" (case-insensitive)
@@ -262,23 +425,20 @@ def detect_ost(folder_path, folder_name, release_info=None):
 
     This function now first checks whether the original folder name contains a curly-braced
     OST symbol (♫). If so, it returns True.
+
+    file_names may be passed in from list_folder_entries to avoid scanning the folder again.
     """
     # Check for OST symbol inside curly braces in the folder name.
     if "♫" in folder_name:
         return True
-    keywords = ["ost", "soundtrack", "オリジナルサウンドトラック"]
-    if any(kw in folder_name.lower() for kw in keywords):
+    if _OST_KW_RE.search(folder_name):
         return True
     if release_info and "title" in release_info:
-        if any(kw in release_info.get("title", "").lower() for kw in keywords):
+        if _OST_KW_RE.search(release_info.get("title", "")):
             return True
-    try:
-        for filename in os.listdir(folder_path):
-            if any(kw in filename.lower() for kw in keywords):
-                return True
-    except Exception as e:
-        print("Error accessing files in folder:", e)
-    return False
+    if file_names is None:
+        file_names = list_folder_entries(folder_path)
+    return any(_OST_KW_RE.search(name) for name in file_names)
 
 
 def detect_fandisc_api(release_info, folder_name):
@@ -286,28 +446,24 @@ def detect_fandisc_api(release_info, folder_name):
     Checks if the release is indicated as a fandisc via API data or the folder name.
     Searches for keywords ("fandisc", "fan disc", "ファンディスク") (case-insensitive).
     """
-    keywords = ["fandisc", "fan disc", "ファンディスク"]
     if release_info and "title" in release_info:
-        if any(kw in release_info.get("title", "").lower() for kw in keywords):
+        if _FANDISC_KW_RE.search(release_info.get("title", "")):
             return True
-    if any(kw in folder_name.lower() for kw in keywords):
+    if _FANDISC_KW_RE.search(folder_name):
         return True
     return False
 
 
-def detect_fandisc_physical(folder_path):
+def detect_fandisc_physical(folder_path, file_names=None):
     """
     Scans file names in the folder for keywords indicating fandisc content.
     Searches for "fandisc", "fan disc", or "ファンディスク" (case-insensitive).
+
+    file_names may be passed in from list_folder_entries to avoid scanning the folder again.
     """
-    keywords = ["fandisc", "fan disc", "ファンディスク"]
-    try:
-        for filename in os.listdir(folder_path):
-            if any(kw in filename.lower() for kw in keywords):
-                return True
-    except Exception as e:
-        print("Error accessing files in folder:", e)
-    return False
+    if file_names is None:
+        file_names = list_folder_entries(folder_path)
+    return any(_FANDISC_KW_RE.search(name) for name in file_names)
 
 
 def detect_language_simple(text):
@@ -315,11 +471,7 @@ def detect_language_simple(text):
     A simple language detection function that checks for any Japanese characters.
     Returns "JP" if any Hiragana, Katakana, or CJK ideographs are found; otherwise, returns "EN".
     """
-    for ch in text:
-        code = ord(ch)
-        if (0x3040 <= code <= 0x309F) or (0x30A0 <= code <= 0x30FF) or (0x4E00 <= code <= 0x9FFF):
-            return "JP"
-    return "EN"
+    return "JP" if _JP_RE.search(text) else "EN"
 
 
 def suggest_new_folder_name(vn_info, release_info, optional_flags=None, optional_tags=None, custom_template=None):
@@ -389,6 +541,165 @@ def suggest_new_folder_name(vn_info, release_info, optional_flags=None, optional
     return folder_name
 
 
+def prefetch_candidates(folder):
+    """
+    Parses the folder name and runs the initial VNDB search for it.
+
+    If the extracted title yields no candidates and contains a space, the search is
+    retried with only the first word. Runs in a worker thread, so API errors are
+    collected in "messages" instead of printed; process_folder() prints them when
+    the folder is presented to the user.
+
+    Returns a dictionary with the folder name, extracted title, expected date and
+    producer, the search query that was used, the scored candidates and the messages.
+    """
+    parsed = parse_folder_name(folder)
+    extracted_title = parsed.get("title", folder)
+    expected_date, expected_producer = parse_bracket_info(folder)
+
+    search_query = extracted_title
+    shortened_from = ""
+    messages = []
+    candidates = get_vn_candidates(search_query, expected_date, expected_producer, messages.append)
+    if not candidates and " " in search_query:
+        shortened_from = search_query
+        search_query = search_query.split(" ", 1)[0].strip()
+        candidates = get_vn_candidates(search_query, expected_date, expected_producer, messages.append)
+
+    return {
+        "folder": folder,
+        "extracted_title": extracted_title,
+        "expected_date": expected_date,
+        "expected_producer": expected_producer,
+        "search_query": search_query,
+        "shortened_from": shortened_from,
+        "candidates": candidates,
+        "messages": messages,
+    }
+
+
+def process_folder(base_dir, prefetched, release_pool):
+    """
+    Walks the user through renaming a single folder, starting from the result of
+    prefetch_candidates. The release lookup for the chosen candidate is submitted to
+    release_pool so it runs while the user enters optional flags; its messages are
+    held back and printed once the flags have been entered.
+    """
+    folder = prefetched["folder"]
+    extracted_title = prefetched["extracted_title"]
+    expected_date = prefetched["expected_date"]
+    expected_producer = prefetched["expected_producer"]
+    search_query = prefetched["search_query"]
+    candidates = prefetched["candidates"]
+
+    print(f"\nFolder: {folder}")
+    print(f"Extracted title for API search: '{extracted_title}'")
+    if expected_date:
+        print(f"Expected release date from folder: '{expected_date}'")
+    if expected_producer:
+        print(f"Expected producer from folder: '{expected_producer}'")
+    for message in prefetched["messages"]:
+        print(message)
+
+    if prefetched["shortened_from"]:
+        print(f"No VN candidates found for '{prefetched['shortened_from']}'. "
+              f"Tried shortened search query: '{search_query}'")
+
+    while not candidates:
+        new_term = input(
+            f"No VN candidates found for '{search_query}'.\nExtracted title is '{extracted_title}'.\nEdit the search term: ") or extracted_title
+        if not new_term.strip():
+            print("No search term provided. Skipping renaming for this folder.\n")
+            break
+        search_query = new_term.strip()
+        candidates = get_vn_candidates(search_query, expected_date, expected_producer)
+    if not candidates:
+        return
+
+    print("\nCandidates:")
+    for idx, candidate in enumerate(candidates, start=1):
+        print(
+            f"{idx}: {candidate.title or 'Unknown Title'} (Confidence: {candidate.score:.0%}) - "
+            f"Released: {candidate.date or 'Unknown'}, Producer: {candidate.producer or 'Unknown'}")
+
+    try:
+        selection = int(input("Select a candidate by number (or 0 to skip renaming): ").strip())
+    except ValueError:
+        print("Invalid input. Skipping renaming for this folder.\n")
+        return
+
+    if selection == 0 or selection > len(candidates):
+        print("Skipping renaming for this folder.\n")
+        return
+
+    vn_info = candidates[selection - 1].raw
+    vn_id = vn_info.get("id")
+    if vn_id and not str(vn_id).startswith("v"):
+        vn_id = "v" + str(vn_id)
+    release_messages = []
+    release_future = release_pool.submit(search_release, vn_id, release_messages.append) if vn_id else None
+    if not vn_id:
+        print("VN id not found; skipping release lookup.")
+
+    user_flags = input(
+        "Enter optional flags (e.g., 18+; separate with commas if multiple; or leave blank): ").strip()
+    release_info = release_future.result() if release_future else None
+    for message in release_messages:
+        print(message)
+
+    api_has_fandisc = detect_fandisc_api(release_info, folder)
+    current_folder_path = os.path.join(base_dir, folder)
+    file_names = list_folder_entries(current_folder_path)
+    physical_fandisc = detect_fandisc_physical(current_folder_path, file_names)
+
+    fandisc_flag = ""
+    if api_has_fandisc:
+        if physical_fandisc:
+            fandisc_flag = "★"
+        else:
+            fandisc_flag = "☆"
+        print(f"Fandisc indicated by API; physical detection: {physical_fandisc}. Using flag: {fandisc_flag}")
+    else:
+        print("No fandisc indicated by API.")
+
+    optional_flags = user_flags
+    if fandisc_flag:
+        if optional_flags:
+            if fandisc_flag not in optional_flags:
+                optional_flags += f", {fandisc_flag}"
+        else:
+            optional_flags = fandisc_flag
+
+    if detect_ost(current_folder_path, folder, release_info, file_names):
+        if optional_flags:
+            if "♫" not in optional_flags:
+                optional_flags += ", ♫"
+        else:
+            optional_flags = "♫"
+        print("OST detected automatically; added OST flag (♫).")
+    else:
+        print("No OST detected automatically.")
+
+    optional_tags = input(
+        "Enter optional API tags (e.g., Romance, Slice of Life; comma-separated; or leave blank): ").strip()
+
+    new_name = suggest_new_folder_name(vn_info, release_info, optional_flags=optional_flags,
+                                       optional_tags=optional_tags)
+    print(f"\nSuggested new folder name: {new_name}\n")
+
+    choice = input("Rename folder? (y/n): ").strip().lower()
+    if choice == 'y':
+        old_path = os.path.join(base_dir, folder)
+        new_path = os.path.join(base_dir, new_name)
+        try:
+            os.rename(old_path, new_path)
+            print("Folder renamed successfully!\n")
+        except Exception as e:
+            print(f"Error renaming folder: {e}\n")
+    else:
+        print("Folder not renamed.\n")
+
+
 def main():
     base_dir = input("Enter the base directory for Visual Novel folders: ").strip()
     if not os.path.exists(base_dir):
@@ -402,122 +713,23 @@ def main():
 
     print(f"\nFound {len(folders)} folder(s) in '{base_dir}'. Processing...\n")
 
-    for folder in folders:
-        print(f"\nFolder: {folder}")
-        parsed = parse_folder_name(folder)
-        extracted_title = parsed.get("title", folder)
-        expected_date, expected_producer = parse_bracket_info(folder)
-        print(f"Extracted title for API search: '{extracted_title}'")
-        if expected_date:
-            print(f"Expected release date from folder: '{expected_date}'")
-        if expected_producer:
-            print(f"Expected producer from folder: '{expected_producer}'")
-
-        search_query = extracted_title
-        print(f"Searching VNDB for visual novel: '{search_query}'")
-
-        candidates = get_vn_candidates(search_query, expected_date, expected_producer)
-        if not candidates and " " in search_query:
-            new_query = search_query.split(" ", 1)[0].strip()
-            print(f"No VN candidates found for '{search_query}'. Trying shortened search query: '{new_query}'")
-            search_query = new_query
-            candidates = get_vn_candidates(search_query, expected_date, expected_producer)
-
-        while not candidates:
-            new_term = input(
-                f"No VN candidates found for '{search_query}'.\nExtracted title is '{extracted_title}'.\nEdit the search term: ") or extracted_title
-            if not new_term.strip():
-                print("No search term provided. Skipping renaming for this folder.\n")
-                break
-            search_query = new_term.strip()
-            candidates = get_vn_candidates(search_query, expected_date, expected_producer)
-        if not candidates:
-            continue
-
-        print("\nCandidates:")
-        for idx, (candidate, confidence) in enumerate(candidates, start=1):
-            cand_title = candidate.get("title", "Unknown Title")
-            cand_release = candidate.get("released", "Unknown")
-            cand_release_formatted = format_release_date(cand_release) if cand_release != "Unknown" else "Unknown"
-            devs = candidate.get("developers", [])
-            if devs and isinstance(devs, list) and len(devs) > 0:
-                candidate_producer = devs[0].get("name", "Unknown") if isinstance(devs[0], dict) else devs[0]
-            else:
-                candidate_producer = "Unknown"
-            print(
-                f"{idx}: {cand_title} (Confidence: {confidence:.0%}) - Released: {cand_release_formatted}, Producer: {candidate_producer}")
-
-        try:
-            selection = int(input("Select a candidate by number (or 0 to skip renaming): ").strip())
-        except ValueError:
-            print("Invalid input. Skipping renaming for this folder.\n")
-            continue
-
-        if selection == 0 or selection > len(candidates):
-            print("Skipping renaming for this folder.\n")
-            continue
-
-        vn_info = candidates[selection - 1][0]
-        vn_id = vn_info.get("id")
-        if vn_id and not str(vn_id).startswith("v"):
-            vn_id = "v" + str(vn_id)
-        release_info = search_release(vn_id) if vn_id else None
-        if not vn_id:
-            print("VN id not found; skipping release lookup.")
-
-        user_flags = input(
-            "Enter optional flags (e.g., 18+; separate with commas if multiple; or leave blank): ").strip()
-
-        api_has_fandisc = detect_fandisc_api(release_info, folder)
-        current_folder_path = os.path.join(base_dir, folder)
-        physical_fandisc = detect_fandisc_physical(current_folder_path)
-
-        fandisc_flag = ""
-        if api_has_fandisc:
-            if physical_fandisc:
-                fandisc_flag = "★"
-            else:
-                fandisc_flag = "☆"
-            print(f"Fandisc indicated by API; physical detection: {physical_fandisc}. Using flag: {fandisc_flag}")
-        else:
-            print("No fandisc indicated by API.")
-
-        optional_flags = user_flags
-        if fandisc_flag:
-            if optional_flags:
-                if fandisc_flag not in optional_flags:
-                    optional_flags += f", {fandisc_flag}"
-            else:
-                optional_flags = fandisc_flag
-
-        if detect_ost(current_folder_path, folder, release_info):
-            if optional_flags:
-                if "♫" not in optional_flags:
-                    optional_flags += ", ♫"
-            else:
-                optional_flags = "♫"
-            print("OST detected automatically; added OST flag (♫).")
-        else:
-            print("No OST detected automatically.")
-
-        optional_tags = input(
-            "Enter optional API tags (e.g., Romance, Slice of Life; comma-separated; or leave blank): ").strip()
-
-        new_name = suggest_new_folder_name(vn_info, release_info, optional_flags=optional_flags,
-                                           optional_tags=optional_tags)
-        print(f"\nSuggested new folder name: {new_name}\n")
-
-        choice = input("Rename folder? (y/n): ").strip().lower()
-        if choice == 'y':
-            old_path = os.path.join(base_dir, folder)
-            new_path = os.path.join(base_dir, new_name)
-            try:
-                os.rename(old_path, new_path)
-                print("Folder renamed successfully!\n")
-            except Exception as e:
-                print(f"Error renaming folder: {e}\n")
-        else:
-            print("Folder not renamed.\n")
+    prefetch_pool = ThreadPoolExecutor(max_workers=_PREFETCH_WORKERS)
+    release_pool = ThreadPoolExecutor(max_workers=_RELEASE_WORKERS)
+    remaining = iter(folders)
+    try:
+        pending = {prefetch_pool.submit(prefetch_candidates, folder)
+                   for folder in itertools.islice(remaining, _PREFETCH_AHEAD)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                # Top up the window before prompting, so the next searches run meanwhile.
+                for folder in itertools.islice(remaining, 1):
+                    pending.add(prefetch_pool.submit(prefetch_candidates, folder))
+                process_folder(base_dir, future.result(), release_pool)
+    finally:
+        # On Ctrl-C or an error, don't keep querying VNDB for folders nobody will see.
+        prefetch_pool.shutdown(wait=False, cancel_futures=True)
+        release_pool.shutdown(wait=False, cancel_futures=True)
 
 
 if __name__ == "__main__":
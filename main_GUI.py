@@ -1,26 +1,49 @@
 import sys
 import os
+import tempfile
 import re
 import requests
 from datetime import datetime
 import difflib
+import functools
+import bisect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 
-from PyQt6.QtGui import QPixmap, QFont, QPainter, QColor
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader, QFont, QPainter, QColor, QPalette
 from PyQt6.QtCore import (
-    Qt, QSize, QRect, QPropertyAnimation, pyqtSignal, QSettings, QUrl, QObject
+    Qt, QSize, QRect, QPropertyAnimation, pyqtSignal, QSettings, QUrl, QObject,
+    QRunnable, QThreadPool, QRectF, QTimer, QBuffer, QByteArray,
+    QAbstractListModel, QModelIndex
 )
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkDiskCache, QNetworkRequest
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QSplitter, QLabel, QLineEdit,
     QPushButton, QListWidget, QListWidgetItem, QFileDialog, QVBoxLayout,
     QHBoxLayout, QFormLayout, QMessageBox, QSpinBox, QCheckBox, QDialog,
     QSizePolicy, QListView, QToolButton, QFrame, QGroupBox, QGridLayout,
-    QComboBox, QRadioButton, QCheckBox, QLabel, QLineEdit, QGraphicsBlurEffect
+    QComboBox, QRadioButton, QCheckBox, QLabel, QLineEdit, QGraphicsBlurEffect,
+    QGraphicsScene, QGraphicsPixmapItem, QStyledItemDelegate, QStyle
 )
 
+_RE_BRACKET = re.compile(r'\[(.*?)\]')
+# One alternation pass; same segments as the old three sequential subs except when
+# differently-typed brackets interleave, e.g. "(a[b)c]".
+_RE_BRACKETED_ANY = re.compile(r'\[.*?\]|\(.*?\)|\{.*?\}')
+_RE_NONWORD = re.compile(r'\W+')
+# ASCII digits only: full-width brackets like [２４０１０１] are not taken as dates.
+_RE_YYMMDD = re.compile(r'\d{2}(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01])', re.ASCII)
+_RE_EMPTY_PAREN = re.compile(r'\(\s*\)')
+# Deletes exactly what _RE_NONWORD matches, restricted to ASCII.
+_ASCII_NONWORD_TABLE = str.maketrans('', '', ''.join(
+    chr(i) for i in range(128) if not (chr(i).isalnum() or chr(i) == '_')))
+
 # -------------------- helpers --------------------
 def normalize_string(s: str) -> str:
-    return re.sub(r'\W+', '', s).lower()
+    if s.isascii():
+        return s.translate(_ASCII_NONWORD_TABLE).lower()
+    return _RE_NONWORD.sub('', s).lower()
 
 def get_confidence_color(match_val: float) -> str:
     p = max(0.0, min(1.0, match_val))
@@ -50,25 +73,39 @@ def create_vndb_shortcut(folder_path: str, vn_id: str) -> None:
     except Exception as e:
         print("Error creating VNDB shortcut:", e)
 
+_CENSOR_MODES = {
+    "blur": "blur",
+    "cover": "box", "box": "box", "black": "box",
+    "pixelate": "pixelate", "pixel": "pixelate", "mosaic": "pixelate",
+}
+
+@functools.lru_cache(maxsize=32)
 def normalize_censor_mode(mode: str | None) -> str:
     """Map UI text ('Blur', 'Cover', etc.) to internal keys."""
-    m = (mode or "").strip().lower()
-    if m in ("blur",): return "blur"
-    if m in ("cover", "box", "black"): return "box"
-    if m in ("pixelate", "pixel", "mosaic"): return "pixelate"
-    return "blur"  # default
+    return _CENSOR_MODES.get((mode or "").strip().lower(), "blur")  # default: blur
 
 def is_adult_from_imageinfo(img: dict | None) -> bool:
     if not isinstance(img, dict): return False
-    sexual = float(img.get("sexual"))
-    violence = float(img.get("violence"))
+    sexual = float(img.get("sexual") or 0)
+    violence = float(img.get("violence") or 0)
     return (sexual >= 1) or (violence >= 1)
 
+def cover_url(entry: dict) -> str | None:
+    img_info = entry.get("image", {})
+    return img_info.get("url") if isinstance(img_info, dict) else None
+
 def is_adult_candidate(cand: dict) -> bool:
-    return is_adult_from_imageinfo(cand.get("image"))
+    # get_vn_candidates stores the flag up front; evaluate only for dicts from elsewhere.
+    adult = cand.get("_is_adult")
+    if adult is None:
+        adult = cand["_is_adult"] = is_adult_from_imageinfo(cand.get("image"))
+    return adult
 
 def is_adult_relation(rel: dict) -> bool:
-    return is_adult_from_imageinfo(rel.get("image"))
+    adult = rel.get("_is_adult")
+    if adult is None:
+        adult = rel["_is_adult"] = is_adult_from_imageinfo(rel.get("image"))
+    return adult
 
 def pixelate_pixmap(pm: QPixmap, factor: int = 12) -> QPixmap:
     w, h = pm.width(), pm.height()
@@ -77,60 +114,90 @@ def pixelate_pixmap(pm: QPixmap, factor: int = 12) -> QPixmap:
     small = pm.scaled(max(1, w // factor), max(1, h // factor),
                       Qt.AspectRatioMode.KeepAspectRatio,
                       Qt.TransformationMode.FastTransformation)
+    # small already has pm's aspect ratio, so don't re-enforce it on the way back up
     return small.scaled(w, h,
-                        Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.AspectRatioMode.IgnoreAspectRatio,
                         Qt.TransformationMode.FastTransformation)
 
-def apply_censor_to_label(label: QLabel, pm: QPixmap,
-                          enabled: bool = True,
-                          mode: str = "blur",
-                          is_adult: bool = False) -> None:
-    """Set pixmap; if adult & enabled, apply blur/cover. Default = blur."""
-    label.setGraphicsEffect(None)
+CENSOR_PIXMAP_CACHE_KB = 64 * 1024
+
+def blurred_pixmap(pm: QPixmap, radius: int = 12) -> QPixmap:
+    """Render pm through a blur effect once and cache the result.
 
+    A QGraphicsBlurEffect on the label itself re-runs the blur on every paint;
+    a pre-blurred pixmap is just blitted.
+    """
+    key = f"censor:{pm.cacheKey()}:blur{radius}"
+    out = QPixmapCache.find(key)
+    if out is None:
+        scene = QGraphicsScene()
+        item = QGraphicsPixmapItem(pm)
+        eff = QGraphicsBlurEffect()
+        eff.setBlurRadius(radius)
+        item.setGraphicsEffect(eff)
+        scene.addItem(item)
+        out = QPixmap(pm.size())
+        out.fill(Qt.GlobalColor.transparent)
+        p = QPainter(out)
+        scene.render(p, QRectF(out.rect()), QRectF(0, 0, pm.width(), pm.height()))
+        p.end()
+        QPixmapCache.insert(key, out)
+    return out
+
+def boxed_pixmap(pm: QPixmap) -> QPixmap:
+    """pm under a near-opaque black cover with an "18+" badge, cached like blurred_pixmap."""
+    key = f"censor:{pm.cacheKey()}:box"
+    over = QPixmapCache.find(key)
+    if over is not None:
+        return over
+    over = QPixmap(pm.size())
+    over.fill(Qt.GlobalColor.transparent)
+    p = QPainter(over)
+    p.drawPixmap(0, 0, pm)
+    p.fillRect(over.rect(), QColor(0, 0, 0, 220))
+    # “18+” badge (top-left)
+    p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+    h = over.height()
+    pad = max(6, h // 40)
+    bw, bh = max(40, h // 8), max(24, h // 12)
+    badge = QRect(pad, pad, bw, bh)
+
+    p.setBrush(QColor(200, 0, 0, 235))
+    p.setPen(Qt.PenStyle.NoPen)
+    p.drawRoundedRect(badge, 6, 6)
+
+    p.setPen(Qt.GlobalColor.white)
+    f: QFont = p.font()
+    f.setBold(True)
+    f.setPointSize(max(10, h // 18))
+    p.setFont(f)
+    p.drawText(badge, Qt.AlignmentFlag.AlignCenter, "18+")
+    p.end()
+    QPixmapCache.insert(key, over)
+    return over
+
+def censored_pixmap(pm: QPixmap,
+                    enabled: bool = True,
+                    mode: str = "blur",
+                    is_adult: bool = False) -> QPixmap:
+    """pm as it should be shown; if adult & enabled, blurred/covered. Default = blur."""
     if not (enabled and is_adult):
-        label.setPixmap(pm)
-        return
+        return pm
 
     m = normalize_censor_mode(mode)
 
-    if m == "blur":
-        label.setPixmap(pm)
-        eff = QGraphicsBlurEffect()
-        eff.setBlurRadius(12)
-        label.setGraphicsEffect(eff)
-    elif m == "box":
-        # draw a semi-opaque black cover on top
-        over = QPixmap(pm.size())
-        over.fill(Qt.GlobalColor.transparent)
-        p = QPainter(over)
-        p.drawPixmap(0, 0, pm)
-        p.fillRect(over.rect(), QColor(0, 0, 0, 220))
-        # “18+” badge (top-left)
-        p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        h = over.height()
-        pad = max(6, h // 40)
-        bw, bh = max(40, h // 8), max(24, h // 12)
-        badge = QRect(pad, pad, bw, bh)
-
-        p.setBrush(QColor(200, 0, 0, 235))
-        p.setPen(Qt.PenStyle.NoPen)
-        p.drawRoundedRect(badge, 6, 6)
-
-        p.setPen(Qt.GlobalColor.white)
-        f: QFont = p.font()
-        f.setBold(True)
-        f.setPointSize(max(10, h // 18))
-        p.setFont(f)
-        p.drawText(badge, Qt.AlignmentFlag.AlignCenter, "18+")
-        p.end()
-        label.setPixmap(over)
-    else:
-        # keep as fallback if you ever re-enable pixelate
-        label.setPixmap(pm)
-        eff = QGraphicsBlurEffect()
-        eff.setBlurRadius(12)
-        label.setGraphicsEffect(eff)
+    if m == "box":
+        return boxed_pixmap(pm)
+    # "blur", and the fallback if you ever re-enable pixelate
+    return blurred_pixmap(pm)
+
+def apply_censor_to_label(label: QLabel, pm: QPixmap,
+                          enabled: bool = True,
+                          mode: str = "blur",
+                          is_adult: bool = False) -> None:
+    """Set pixmap; if adult & enabled, apply blur/cover. Default = blur."""
+    label.setGraphicsEffect(None)
+    label.setPixmap(censored_pixmap(pm, enabled=enabled, mode=mode, is_adult=is_adult))
 
 
 # -------------------- image loading --------------------
@@ -147,18 +214,77 @@ def _placeholder_pixmap(size: int) -> QPixmap:
     return pm
 
 
+IMAGE_DISK_CACHE_DIR = os.path.join(tempfile.gettempdir(), "vnrename_img")
+IMAGE_DISK_CACHE_BYTES = 200 * 1024 * 1024
+
+
+class _ImageDecodeSignals(QObject):
+    decoded = pyqtSignal(str, int, QImage)  # url, size, image
+
+
+class ImageDecodeTask(QRunnable):
+    """Decodes and scales downloaded image bytes on a worker thread."""
+
+    def __init__(self, url: str, size: int, data: bytes, signals: _ImageDecodeSignals) -> None:
+        super().__init__()
+        self._url = url
+        self._size = size
+        self._data = data
+        self._signals = signals
+
+    def run(self) -> None:
+        # QImage is safe to use off the GUI thread; QPixmap is not.
+        buf = QBuffer()
+        buf.setData(QByteArray(self._data))
+        reader = QImageReader(buf)
+        full = reader.size()
+        if self._size and full.isValid():
+            # Let the decoder target the thumbnail size directly (JPEG can skip
+            # most of the work via DCT scaling) instead of decoding full-size first.
+            reader.setScaledSize(full.scaled(
+                self._size, self._size, Qt.AspectRatioMode.KeepAspectRatio
+            ))
+        img = reader.read()
+        if self._size and not full.isValid() and not img.isNull():
+            img = img.scaled(
+                self._size,
+                self._size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+        self._signals.decoded.emit(self._url, self._size, img)
+
+
 class ImageFetcher(QObject):
-    """Fetches images asynchronously using Qt network stack."""
+    """Fetches images asynchronously using Qt network stack.
+
+    Responses are kept in an on-disk cache, so covers already seen (in this or
+    an earlier session, at any size) are served without a network round-trip.
+    Decoding and scaling run on a small thread pool so the GUI thread only
+    converts the finished QImage to a QPixmap.
+    """
 
     fetched = pyqtSignal(str, int, QPixmap)  # url, size, pixmap
 
     def __init__(self, parent: QObject | None = None) -> None:
         super().__init__(parent)
         self._nam = QNetworkAccessManager(self)
+        disk_cache = QNetworkDiskCache(self)
+        disk_cache.setCacheDirectory(IMAGE_DISK_CACHE_DIR)
+        disk_cache.setMaximumCacheSize(IMAGE_DISK_CACHE_BYTES)
+        self._nam.setCache(disk_cache)
         self._nam.finished.connect(self._finished)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(4)
+        self._signals = _ImageDecodeSignals(self)
+        self._signals.decoded.connect(self._decoded)
 
     def fetch(self, url: str, size: int) -> None:
         request = QNetworkRequest(QUrl(url))
+        request.setAttribute(
+            QNetworkRequest.Attribute.CacheLoadControlAttribute,
+            QNetworkRequest.CacheLoadControl.PreferCache,
+        )
         reply = self._nam.get(request)
         reply._url = url
         reply._size = size
@@ -167,22 +293,18 @@ class ImageFetcher(QObject):
         url = getattr(reply, "_url", "")
         size = getattr(reply, "_size", 0)
         data = bytes(reply.readAll())
-        pm = QPixmap()
-        pm.loadFromData(data)
-        if size:
-            pm = pm.scaled(
-                size,
-                size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-        self.fetched.emit(url, size, pm)
         reply.deleteLater()
+        self._pool.start(ImageDecodeTask(url, size, data, self._signals))
+
+    def _decoded(self, url: str, size: int, img: QImage) -> None:
+        self.fetched.emit(url, size, QPixmap.fromImage(img))
 
 
 class AsyncImageLoader(QObject):
     """Caches and delivers scaled pixmaps to labels asynchronously."""
 
+    loaded = pyqtSignal(str, int)  # url, size; the pixmap is now in IMAGE_CACHE
+
     def __init__(self) -> None:
         super().__init__()
         self._fetcher = ImageFetcher(self)
@@ -203,9 +325,16 @@ class AsyncImageLoader(QObject):
             apply_censor_to_label(label, IMAGE_CACHE[key], enabled=censor_enabled, mode=censor_mode, is_adult=is_adult)
             return
         label.setPixmap(_placeholder_pixmap(size))
-        self._pending.setdefault(key, []).append((label, censor_enabled, censor_mode, is_adult))
-        if len(self._pending[key]) == 1:
-            self._fetcher.fetch(url, size)
+        self.request(url, size)
+        self._pending[key].append((label, censor_enabled, censor_mode, is_adult))
+
+    def request(self, url: str, size: int) -> None:
+        """Start fetching (url, size) unless it is cached or already in flight; see `loaded`."""
+        key = (url, size)
+        if key in IMAGE_CACHE or key in self._pending:
+            return
+        self._pending[key] = []
+        self._fetcher.fetch(url, size)
 
     def _apply(self, url: str, size: int, pm: QPixmap) -> None:
         key = (url, size)
@@ -213,6 +342,7 @@ class AsyncImageLoader(QObject):
         for label, enabled, mode, adult in self._pending.get(key, []):
             apply_censor_to_label(label, pm, enabled=enabled, mode=mode, is_adult=adult)
         self._pending.pop(key, None)
+        self.loaded.emit(url, size)
 
 
 ASYNC_IMAGE_LOADER = AsyncImageLoader()
@@ -246,6 +376,16 @@ class CollapsiblePanel(QWidget):
 
 class CustomTemplateEditor(QListWidget):
     templateChanged = pyqtSignal()
+
+    _PART_MAP = {
+        "producer": "[{producer}]",
+        "release_date": "[{release_date}]",
+        "length": "{length}",
+        "title": "{title}",
+        "flags": "{flags}",
+        "tags": "({tags})",
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFlow(QListView.Flow.LeftToRight)
@@ -259,63 +399,67 @@ class CustomTemplateEditor(QListWidget):
             it.setFlags(it.flags() | Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
             it.setCheckState(Qt.CheckState.Checked)
             self.addItem(it)
-        self.itemChanged.connect(lambda _: self.templateChanged.emit())
+        self._template: str | None = None
+        self.itemChanged.connect(lambda _: self._changed())
 
     def dropEvent(self, e):
         super().dropEvent(e)
+        self._changed()
+
+    def _changed(self) -> None:
+        self._template = None
         self.templateChanged.emit()
 
     def getTemplate(self) -> str:
-        parts = []
-        for i in range(self.count()):
-            item = self.item(i)
-            if item.checkState() != Qt.CheckState.Checked:
-                continue
-            t = item.text()
-            parts.append({
-                "producer": "[{producer}]",
-                "release_date": "[{release_date}]",
-                "length": "{length}",
-                "title": "{title}",
-                "flags": "{flags}",
-                "tags": "({tags})",
-            }.get(t, "{" + t + "}"))
-        return " ".join(parts)
+        if self._template is None:
+            parts = []
+            for i in range(self.count()):
+                item = self.item(i)
+                if item.checkState() != Qt.CheckState.Checked:
+                    continue
+                t = item.text()
+                parts.append(self._PART_MAP.get(t, "{" + t + "}"))
+            self._template = " ".join(parts)
+        return self._template
 
 # -------------------- parsing --------------------
 def parse_folder_name(folder_name: str):
-    cleaned = re.sub(r'\[.*?\]', '', folder_name)
-    cleaned = re.sub(r'\(.*?\)', '', cleaned)
-    cleaned = re.sub(r'\{.*?\}', '', cleaned)
-    return {"title": cleaned.strip(), "release": ""}
+    return {"title": _RE_BRACKETED_ANY.sub('', folder_name).strip(), "release": ""}
 
 def parse_bracket_info(folder_name: str):
-    matches = re.findall(r'\[(.*?)\]', folder_name)
+    matches = _RE_BRACKET.findall(folder_name)
     expected_date = ""; expected_producer = ""
     for segment in matches:
         segment = segment.strip()
-        if segment.isdigit() and len(segment) == 6:
-            try:
-                mm = int(segment[2:4]); dd = int(segment[4:6])
-                if 1 <= mm <= 12 and 1 <= dd <= 31:
-                    expected_date = segment
-            except ValueError:
-                pass
-        elif len(segment) >= 3 and not (segment.isdigit() and len(segment) > 6) and not expected_producer:
+        if _RE_YYMMDD.fullmatch(segment):
+            expected_date = segment
+        elif len(segment) >= 3 and not (len(segment) >= 6 and segment.isascii() and segment.isdigit()) and not expected_producer:
             expected_producer = segment
     return expected_date, expected_producer
 
 # -------------------- API --------------------
+# One keep-alive session so consecutive vndb calls reuse the same TLS connection.
+_SESSION = requests.Session()
+_SESSION.headers.update({"Content-Type": "application/json"})
+
 def _post(url: str, payload: dict):
-    headers = {"Content-Type": "application/json"}
     try:
-        r = requests.post(url, headers=headers, json=payload, timeout=10)
+        r = _SESSION.post(url, json=payload, timeout=10)
         r.raise_for_status()
         return r.json()
     except Exception as e:
         print("API error:", e)
         return None
 
+@functools.lru_cache(maxsize=4096)
+def _ratio(a: str, b: str) -> float:
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+def _date_sim(a: str, b: str) -> float:
+    """Share of positions where two (fixed-format) date strings agree."""
+    n = max(len(a), len(b))
+    return sum(x == y for x, y in zip(a, b)) / n if n else 0.0
+
 def get_vn_candidates(search_query, expected_date="", expected_producer="", candidate_limit=5):
     payload = {
         "filters": ["search", "=", search_query],
@@ -328,14 +472,21 @@ def get_vn_candidates(search_query, expected_date="", expected_producer="", cand
     if not data or not isinstance(data.get("results"), list):
         return []
     results = []
+    # The query goes in seq2 so its b2j index is built once and reused for every title.
+    # ratio() is not symmetric, so scores (and the top-5 order) can differ slightly
+    # from the old ratio(title, query) ordering.
+    sm = difflib.SequenceMatcher(autojunk=False)
+    sm.set_seq2(search_query.lower())
     for cand in data["results"]:
         romaji = cand.get("title", "")
-        sim_romaji = difflib.SequenceMatcher(None, search_query.lower(), romaji.lower()).ratio()
-        sim_jp = 0.0
+        sm.set_seq1(romaji.lower())
+        title_sim = sm.ratio()
         for t in cand.get("titles", []):
-            orig = t.get("title", "")
-            sim_jp = max(sim_jp, difflib.SequenceMatcher(None, search_query.lower(), orig.lower()).ratio())
-        title_sim = max(sim_romaji, sim_jp)
+            sm.set_seq1(t.get("title", "").lower())
+            # Cheap upper bounds first; most alternate titles cannot beat the best so far.
+            if sm.real_quick_ratio() <= title_sim or sm.quick_ratio() <= title_sim:
+                continue
+            title_sim = max(title_sim, sm.ratio())
 
         date_sim = 0.5
         rel = cand.get("released", "")
@@ -344,15 +495,19 @@ def get_vn_candidates(search_query, expected_date="", expected_producer="", cand
                 norm = f"20{expected_date[:2]}-{expected_date[2:4]}-{expected_date[4:6]}"
             else:
                 norm = expected_date
-            date_sim = difflib.SequenceMatcher(None, norm, rel).ratio()
+            date_sim = _date_sim(norm, rel)
 
         devs = cand.get("developers", [])
         devname = devs[0].get("name", "") if devs and isinstance(devs[0], dict) else (devs[0] if devs else "")
         dev_sim = 0.5
         if expected_producer and devname:
-            dev_sim = difflib.SequenceMatcher(None, normalize_string(expected_producer), normalize_string(devname)).ratio()
+            dev_sim = _ratio(normalize_string(expected_producer), normalize_string(devname))
 
         cand["match"] = (title_sim + date_sim + dev_sim) / 3.0
+        cand["id"] = _vn_key(cand.get("id"))
+        cand["_is_adult"] = is_adult_from_imageinfo(cand.get("image"))
+        for rel in cand.get("relations", []):
+            rel["_is_adult"] = is_adult_from_imageinfo(rel.get("image"))
         results.append(cand)
 
     results.sort(key=lambda c: c["match"], reverse=True)
@@ -403,8 +558,79 @@ def search_release(vn_id: str):
             return rel
     return releases[0]
 
+# Bounded LRU caches for repeat lookups (re-running a search, re-clicking a candidate).
+# Failed or empty lookups are not cached so they are retried next time.
+_API_CACHE_SIZE = 128
+_CANDIDATE_CACHE: OrderedDict = OrderedDict()
+_RELEASE_CACHE: OrderedDict = OrderedDict()
+_API_CACHE_LOCK = threading.Lock()  # lookups also run on ApiTask worker threads
+
+def _cached(cache: OrderedDict, key, compute):
+    with _API_CACHE_LOCK:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+    value = compute()
+    if value:
+        with _API_CACHE_LOCK:
+            cache[key] = value
+            if len(cache) > _API_CACHE_SIZE:
+                cache.popitem(last=False)
+    return value
+
+def cached_vn_candidates(search_query, expected_date="", expected_producer="", candidate_limit=5):
+    key = (search_query, expected_date, expected_producer, candidate_limit)
+    return _cached(_CANDIDATE_CACHE, key, lambda: get_vn_candidates(*key))
+
+def cached_release(vn_id: str):
+    return _cached(_RELEASE_CACHE, vn_id, lambda: search_release(vn_id))
+
+def _vn_key(vnid) -> str:
+    if isinstance(vnid, str) and (not vnid or vnid.startswith("v")):
+        return vnid
+    return f"v{vnid}" if vnid else ""
+
+
+class _ApiSignals(QObject):
+    finished = pyqtSignal(int, object)  # request token, result
+    failed = pyqtSignal(int, str)       # request token, error message
+
+
+class ApiTask(QRunnable):
+    """Runs a blocking vndb call on a worker thread and reports back via signals.
+
+    The token lets the receiver drop results that were superseded by a newer
+    request while this one was in flight.
+    """
+
+    def __init__(self, token: int, fn, signals: _ApiSignals) -> None:
+        super().__init__()
+        self._token = token
+        self._fn = fn
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            result = self._fn()
+        except Exception as e:
+            self._signals.failed.emit(self._token, str(e))
+            return
+        self._signals.finished.emit(self._token, result)
+
 
 # -------------------- naming --------------------
+_RE_YMD = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_yymmdd(ds: str) -> str:
+    """YYYY-MM-DD -> YYMMDD; 'Unknown' if ds isn't a date."""
+    m = _RE_YMD.fullmatch(ds)
+    if m:
+        y, mo, d = m.groups()
+        return f"{y[2:]}{mo}{d}"
+    try: return datetime.strptime(ds, "%Y-%m-%d").strftime("%y%m%d")
+    except Exception: return "Unknown"
+
 def suggest_new_folder_name(vn_info, release_info, optional_flags=None, optional_tags=None, custom_template=None, title_override=None):
     producer = "Unknown Producer"
     if release_info and release_info.get("producers"):
@@ -421,59 +647,54 @@ def suggest_new_folder_name(vn_info, release_info, optional_flags=None, optional
 
     date_str = release_info.get("released") if (release_info and release_info.get("released")) else vn_info.get("released", "")
 
-    def fmt(ds):
-        try: return datetime.strptime(ds, "%Y-%m-%d").strftime("%y%m%d")
-        except Exception: return "Unknown"
-
-    formatted_date = fmt(date_str) if date_str else "Unknown"
+    formatted_date = _fmt_yymmdd(date_str) if date_str else "Unknown"
     length_str = f"[L{vn_info.get('length')}]" if vn_info.get("length") is not None else ""
     title_str = title_override or vn_info.get("title", "Unknown Title")
     flags_str = (optional_flags or "").strip()
     tags_str  = (optional_tags  or "").strip()
 
+    return _render_folder_name(producer, formatted_date, length_str, title_str, flags_str, tags_str, custom_template)
+
+@functools.lru_cache(maxsize=256)
+def _render_folder_name(producer, formatted_date, length_str, title_str, flags_str, tags_str, custom_template):
     if custom_template and custom_template.strip():
         try:
             name = custom_template.format(
                 producer=producer, release_date=formatted_date, length=length_str,
                 title=title_str, flags=flags_str, tags=tags_str
             )
-            name = re.sub(r"\(\s*\)", "", name).strip()
+            name = _RE_EMPTY_PAREN.sub("", name).strip()
             return name
         except KeyError as e:
             return f"Error: missing placeholder {e}"
 
-    name = f"[{producer}][{formatted_date}]{length_str} {title_str}"
-    if flags_str: name += f" {{{flags_str}}}"
-    if tags_str:  name += f" ({tags_str})"
-    return name
+    parts = [f"[{producer}][{formatted_date}]{length_str} {title_str}"]
+    if flags_str: parts.append(f"{{{flags_str}}}")
+    if tags_str:  parts.append(f"({tags_str})")
+    return " ".join(parts)
 
 # -------------------- dialogs --------------------
 class CandidateDetailDialog(QDialog):
+    _F_TITLE = _F_MATCH = _F_BODY = None
+
+    @classmethod
+    def _fonts(cls):
+        # Built on first use (a QApplication must exist), then shared by every dialog.
+        if cls._F_TITLE is None:
+            cls._F_TITLE = QFont(); cls._F_TITLE.setPointSize(24)
+            cls._F_MATCH = QFont(); cls._F_MATCH.setPointSize(22)
+            cls._F_BODY = QFont(); cls._F_BODY.setPointSize(20)
+
     def __init__(self, candidate, censor_enabled=True, censor_mode="pixelate", parent=None):
         super().__init__(parent)
+        self._fonts()
         self.setWindowTitle("Candidate Details")
         self.resize(820, 520)
         self.candidate = candidate
         self.censor_enabled = censor_enabled
-        self.censor_mode = censor_mode
+        self.censor_mode = normalize_censor_mode(censor_mode)
         self.match_val = candidate.get("match", 0.0)
 
-        _MINAGE_CACHE = {}
-
-        def get_minage_for_vn(vnid) -> int:
-            v = f"v{vnid}" if vnid and not str(vnid).startswith("v") else str(vnid or "")
-            if not v:
-                return 0
-            if v in _MINAGE_CACHE:
-                return _MINAGE_CACHE[v]
-            rel = search_release(v)
-            val = int((rel or {}).get("minage") or 0)
-            _MINAGE_CACHE[v] = val
-            return val
-
-        def is_adult_vn(vnid) -> bool:
-            return get_minage_for_vn(vnid) >= 18
-
         outer = QVBoxLayout(self)
 
         info = QHBoxLayout(); info.setSpacing(12)
@@ -487,8 +708,8 @@ class CandidateDetailDialog(QDialog):
                 self.img_label,
                 url,
                 300,
-                censor_enabled=getattr(self, "censor_enabled", True),
-                censor_mode=normalize_censor_mode(getattr(self, "censor_mode", "blur")),
+                censor_enabled=self.censor_enabled,
+                censor_mode=self.censor_mode,
                 is_adult=is_adult_candidate(self.candidate),
             )
         else:
@@ -498,20 +719,20 @@ class CandidateDetailDialog(QDialog):
         # Text
         text = QVBoxLayout(); text.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
         title = QLabel(self.candidate.get("title", "Unknown Title")); title.setWordWrap(True)
-        f_title = QFont(); f_title.setPointSize(24); title.setFont(f_title); text.addWidget(title)
+        title.setFont(self._F_TITLE); text.addWidget(title)
 
         conf_color = get_confidence_color(self.match_val)
         match = QLabel(f'<font color="{conf_color}">Match: {self.match_val:.0%}</font>')
-        f_match = QFont(); f_match.setPointSize(22); match.setFont(f_match); text.addWidget(match)
+        match.setFont(self._F_MATCH); text.addWidget(match)
 
-        rel = QLabel(f"Released: {self.candidate.get('released', 'Unknown')}"); f_rel = QFont(); f_rel.setPointSize(20); rel.setFont(f_rel); text.addWidget(rel)
+        rel = QLabel(f"Released: {self.candidate.get('released', 'Unknown')}"); rel.setFont(self._F_BODY); text.addWidget(rel)
 
         devs = self.candidate.get("developers", [])
         producer = devs[0].get("name", "Unknown") if devs and isinstance(devs[0], dict) else (devs[0] if devs else "Unknown")
-        prod = QLabel(f"Producer: {producer}"); f_prod = QFont(); f_prod.setPointSize(20); prod.setFont(f_prod); text.addWidget(prod)
+        prod = QLabel(f"Producer: {producer}"); prod.setFont(self._F_BODY); text.addWidget(prod)
 
         rating = self.candidate.get("rating", None)
-        rate = QLabel(f"Rating: {rating}" if rating is not None else "Rating: N/A"); f_rate = QFont(); f_rate.setPointSize(20); rate.setFont(f_rate); text.addWidget(rate)
+        rate = QLabel(f"Rating: {rating}" if rating is not None else "Rating: N/A"); rate.setFont(self._F_BODY); text.addWidget(rate)
 
         info.addLayout(text)
         outer.addLayout(info)
@@ -540,8 +761,8 @@ class CandidateDetailDialog(QDialog):
                         img,
                         url,
                         100,
-                        censor_enabled=getattr(self, "censor_enabled", True),
-                        censor_mode=normalize_censor_mode(getattr(self, "censor_mode", "blur")),
+                        censor_enabled=self.censor_enabled,
+                        censor_mode=self.censor_mode,
                         is_adult=is_adult_relation(rel),
                     )
                 else:
@@ -558,57 +779,129 @@ class CandidateDetailDialog(QDialog):
         else:
             outer.addWidget(QLabel("No official related visual novels found."))
 
-class CandidateTile(QWidget):
-    def __init__(self, candidate, parent=None):
+class CandidateModel(QAbstractListModel):
+    """Candidate dicts behind the candidate list; covers come from ASYNC_IMAGE_LOADER.
+
+    Covers are fetched lazily: only when the delegate asks for a row's
+    decoration, i.e. when that row is actually painted.
+    """
+
+    COVER_SIZE = 150
+
+    def __init__(self, parent: QObject | None = None) -> None:
         super().__init__(parent)
-        self.candidate = candidate
-        self.censor_enabled = True
-        self.censor_mode = "pixelate"
-        self.match_val = candidate.get("match", 0.0)
-        main = QHBoxLayout(self); main.setContentsMargins(8, 8, 8, 8); main.setSpacing(12)
+        self._candidates: list[dict] = []
+        self._censor_enabled = True
+        self._censor_mode = "blur"
+        ASYNC_IMAGE_LOADER.loaded.connect(self._cover_loaded)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._candidates)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        cand = self._candidates[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return cand
+        if role == Qt.ItemDataRole.DisplayRole:
+            return cand.get("title", "Unknown Title")
+        if role == Qt.ItemDataRole.DecorationRole:
+            url = cover_url(cand)
+            pm = IMAGE_CACHE.get((url, self.COVER_SIZE)) if url else None
+            if pm is None:
+                if url:
+                    ASYNC_IMAGE_LOADER.request(url, self.COVER_SIZE)
+                return _placeholder_pixmap(self.COVER_SIZE)
+            return censored_pixmap(pm, enabled=self._censor_enabled, mode=self._censor_mode,
+                                   is_adult=is_adult_candidate(cand))
+        return None
 
-        # image
-        self.image_label = QLabel()
-        self.image_label.setFixedSize(150, 150)
-        img_info = candidate.get("image", {})
-        url = img_info.get("url") if isinstance(img_info, dict) else None
-        if url:
-            ASYNC_IMAGE_LOADER.load(
-                self.image_label,
-                url,
-                150,
-                censor_enabled=getattr(parent, "censor_checkbox", None).isChecked()
-                if parent and getattr(parent, "censor_checkbox", None)
-                else True,
-                censor_mode=normalize_censor_mode(
-                    getattr(parent, "censor_mode", None).currentText()
-                    if parent and getattr(parent, "censor_mode", None)
-                    else "Blur"
-                ),
-                is_adult=is_adult_candidate(candidate),
-            )
-        else:
-            self.image_label.setPixmap(_placeholder_pixmap(150))
-        main.addWidget(self.image_label, alignment=Qt.AlignmentFlag.AlignTop)
+    def set_candidates(self, candidates: list[dict]) -> None:
+        self.beginResetModel()
+        self._candidates = list(candidates)
+        self.endResetModel()
 
-        # text column
-        text = QVBoxLayout(); text.setContentsMargins(0, 0, 0, 0); text.setSpacing(6)
-        title = QLabel(candidate.get("title", "Unknown Title")); title.setWordWrap(True)
-        f_title = QFont(); f_title.setPointSize(16); title.setFont(f_title)
-        conf_color = get_confidence_color(self.match_val)
-        match = QLabel(f'<font color="{conf_color}">Match: {self.match_val:.0%}</font>'); f_match = QFont(); f_match.setPointSize(18); match.setFont(f_match)
-        rel = QLabel(f"Released: {candidate.get('released', 'Unknown')}"); f_rel = QFont(); f_rel.setPointSize(14); rel.setFont(f_rel)
-        devs = candidate.get("developers", [])
+    def clear(self) -> None:
+        self.set_candidates([])
+
+    def set_censor(self, enabled: bool, mode: str) -> None:
+        if (enabled, mode) == (self._censor_enabled, self._censor_mode):
+            return
+        # Switching modes while censoring is off changes nothing on screen.
+        visible = enabled or self._censor_enabled
+        self._censor_enabled = enabled
+        self._censor_mode = mode
+        if visible and self._candidates:
+            self.dataChanged.emit(self.index(0), self.index(len(self._candidates) - 1),
+                                  [Qt.ItemDataRole.DecorationRole])
+
+    def _cover_loaded(self, url: str, size: int) -> None:
+        if size != self.COVER_SIZE:
+            return
+        for row, cand in enumerate(self._candidates):
+            if cover_url(cand) == url:
+                idx = self.index(row)
+                self.dataChanged.emit(idx, idx, [Qt.ItemDataRole.DecorationRole])
+
+class CandidateDelegate(QStyledItemDelegate):
+    """Paints a candidate row (cover, title, match, release, producer) with no child widgets."""
+
+    _F_TITLE = _F_MATCH = _F_BODY = None
+    MARGIN, SPACING, LINE_SPACING = 8, 12, 6
+
+    @classmethod
+    def _fonts(cls):
+        if cls._F_TITLE is None:
+            cls._F_TITLE = QFont(); cls._F_TITLE.setPointSize(16)
+            cls._F_MATCH = QFont(); cls._F_MATCH.setPointSize(18)
+            cls._F_BODY = QFont(); cls._F_BODY.setPointSize(14)
+
+    def paint(self, painter, option, index):
+        self._fonts()
+        cand = index.data(Qt.ItemDataRole.UserRole) or {}
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, option.widget)
+
+        painter.save()
+        size = CandidateModel.COVER_SIZE
+        r = option.rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        pm = index.data(Qt.ItemDataRole.DecorationRole)
+        if isinstance(pm, QPixmap) and not pm.isNull():
+            painter.drawPixmap(r.left(), r.top() + (size - pm.height()) // 2, pm)
+
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        text_color = option.palette.color(
+            QPalette.ColorRole.HighlightedText if selected else QPalette.ColorRole.Text
+        )
+        x = r.left() + size + self.SPACING
+        w = max(0, r.right() - x)
+        y = r.top()
+
+        def line(text: str, font: QFont, color: QColor, flags=Qt.TextFlag.TextSingleLine) -> None:
+            nonlocal y
+            painter.setFont(font)
+            painter.setPen(color)
+            box = painter.boundingRect(QRect(x, y, w, r.bottom() - y),
+                                       Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | flags, text)
+            painter.drawText(box, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | flags, text)
+            y = box.bottom() + self.LINE_SPACING
+
+        match_val = cand.get("match", 0.0)
+        devs = cand.get("developers", [])
         producer = devs[0].get("name", "Unknown") if devs and isinstance(devs[0], dict) else (devs[0] if devs else "Unknown")
-        prod = QLabel(f"Producer: {producer}"); f_prod = QFont(); f_prod.setPointSize(14); prod.setFont(f_prod)
-        text.addWidget(title); text.addWidget(match); text.addWidget(rel); text.addWidget(prod); text.addStretch(1)
-        main.addLayout(text)
-        self.setMinimumHeight(160)
+        line(cand.get("title", "Unknown Title"), self._F_TITLE, text_color, Qt.TextFlag.TextWordWrap)
+        line(f"Match: {match_val:.0%}", self._F_MATCH, QColor(get_confidence_color(match_val)))
+        line(f"Released: {cand.get('released', 'Unknown')}", self._F_BODY, text_color)
+        line(f"Producer: {producer}", self._F_BODY, text_color)
+        painter.restore()
 
-    def sizeHint(self):
+    def sizeHint(self, option, index):
         return QSize(360, 160)
 
 # -------------------- main window --------------------
+SUGGEST_DEBOUNCE_MS = 150
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -617,6 +910,24 @@ class MainWindow(QMainWindow):
         last = self.settings.value("lastDirectory", "")
         self.directory = last if last and os.path.isdir(str(last)) else None
 
+        # Coalesces bursts of edits (typing tags, toggling flags) into one re-render.
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(SUGGEST_DEBOUNCE_MS)
+        self._update_timer.timeout.connect(self._do_update_suggested_name)
+        # folder name -> (parse_folder_name result, expected date, expected producer)
+        self._folder_meta: dict[str, tuple[dict, str, str]] = {}
+
+        # vndb lookups run on the global pool; tokens discard stale replies.
+        self._search_token = 0
+        self._search_signals = _ApiSignals(self)
+        self._search_signals.finished.connect(self._on_candidates_ready)
+        self._search_signals.failed.connect(self._on_search_failed)
+        self._release_token = 0
+        self._release_signals = _ApiSignals(self)
+        self._release_signals.finished.connect(self._on_release_ready)
+        self._release_signals.failed.connect(self._on_release_failed)
+
         main_splitter = QSplitter(Qt.Orientation.Horizontal, self)
         main_splitter.setHandleWidth(6)
         main_splitter.setStretchFactor(0, 4)
@@ -711,9 +1022,16 @@ class MainWindow(QMainWindow):
         search_row.addWidget(self.candidate_count_spin)
         search_v.addLayout(search_row)
 
-        self.candidate_list = QListWidget()
-        self.candidate_list.itemClicked.connect(self.select_candidate)
-        self.candidate_list.itemDoubleClicked.connect(self.open_candidate_detail)
+        # Rows are painted by CandidateDelegate; no widget is built per candidate.
+        self.candidate_model = CandidateModel(self)
+        self.candidate_model.set_censor(self.censor_checkbox.isChecked(),
+                                        normalize_censor_mode(self.censor_mode.currentText()))
+        self.candidate_list = QListView()
+        self.candidate_list.setModel(self.candidate_model)
+        self.candidate_list.setItemDelegate(CandidateDelegate(self.candidate_list))
+        self.candidate_list.setUniformItemSizes(True)
+        self.candidate_list.clicked.connect(self.select_candidate)
+        self.candidate_list.doubleClicked.connect(self.open_candidate_detail)
         search_v.addWidget(QLabel("Candidates:"))
         search_v.addWidget(self.candidate_list)
 
@@ -737,6 +1055,9 @@ class MainWindow(QMainWindow):
         self.suggested_name_edit.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         right_v.addWidget(self.suggested_label)
         right_v.addWidget(self.suggested_name_edit)
+        # Set by typing in the field, cleared whenever a fresh suggestion is written.
+        self._name_edited = False
+        self.suggested_name_edit.textEdited.connect(lambda _: setattr(self, "_name_edited", True))
 
         self.rename_button = QPushButton("Rename Folder"); self.rename_button.setMaximumSize(150, 30)
         self.rename_button.clicked.connect(self.rename_folder); right_v.addWidget(self.rename_button)
@@ -752,9 +1073,11 @@ class MainWindow(QMainWindow):
         og_v.addLayout(toggles)
 
         self.flag_checkboxes = {}
+        self._active_flags: set[str] = set()  # kept in sync by the toggled handlers
         flags_layout = QHBoxLayout()
         for symbol, desc in {"★": "Fandisc Confirmed", "☆": "Fandisc Expected", "♫": "OST Included"}.items():
-            cb = QCheckBox(f"{symbol}\n({desc})"); cb.toggled.connect(self.update_suggested_name)
+            cb = QCheckBox(f"{symbol}\n({desc})")
+            cb.toggled.connect(lambda checked, s=symbol: self._flag_toggled(s, checked))
             self.flag_checkboxes[symbol] = cb; flags_layout.addWidget(cb)
         self.flags_panel = CollapsiblePanel("Optional Flags"); self.flags_panel.setContentLayout(flags_layout); og_v.addWidget(self.flags_panel)
 
@@ -795,22 +1118,42 @@ class MainWindow(QMainWindow):
             return
         self.folder_list.clear()
         try:
-            folders = [f for f in os.listdir(self.directory) if os.path.isdir(os.path.join(self.directory, f))]
-            self.folder_list.addItems(sorted(folders))
+            with os.scandir(self.directory) as it:
+                # Case-insensitive order; the casefold key is computed once per name.
+                folders = sorted((e.name for e in it if e.is_dir()), key=str.casefold)
+            for gone in self._folder_meta.keys() - set(folders):
+                del self._folder_meta[gone]
+            self.folder_list.addItems(folders)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Error reading directory: {e}")
 
+    def folder_meta(self, folder_name: str) -> tuple[dict, str, str]:
+        meta = self._folder_meta.get(folder_name)
+        if meta is None:
+            meta = (parse_folder_name(folder_name), *parse_bracket_info(folder_name))
+            self._folder_meta[folder_name] = meta
+        return meta
+
     def load_folder_details(self, item: QListWidgetItem):
         try:
             folder_name = item.text()
             self.current_folder_name = folder_name
             self.current_folder_path = os.path.join(self.directory, folder_name)
             self.original_value.setText(folder_name)
-            parsed = parse_folder_name(folder_name)
+            parsed, expected_date, expected_producer = self.folder_meta(folder_name)
             self.title_edit.setText(parsed.get("title", folder_name))
-            expected_date, expected_producer = parse_bracket_info(folder_name)
             self.expected_info_label.setText(f"Expected Release Date: {expected_date} | Expected Producer: {expected_producer}")
-            self.candidate_list.clear()
+            # Drop replies to searches and release lookups started for the
+            # previously selected folder, and forget its candidate.
+            self._search_token += 1
+            self._release_token += 1
+            self.vn_info = None
+            self.release_info = None
+            self.search_button.setEnabled(True)
+            self.rename_button.setEnabled(True)
+            # A debounced rebuild queued for the old folder must not fire now.
+            self._update_timer.stop()
+            self.candidate_model.clear()
             self.suggested_name_edit.clear()
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Error loading folder details: {e}")
@@ -820,39 +1163,67 @@ class MainWindow(QMainWindow):
         if not query:
             QMessageBox.warning(self, "Error", "No search query provided.")
             return
-        expected_date, expected_producer = parse_bracket_info(self.current_folder_name)
+        _, expected_date, expected_producer = self.folder_meta(self.current_folder_name)
         limit = self.candidate_count_spin.value()
-        candidates = get_vn_candidates(query, expected_date, expected_producer, limit)
-        if not candidates and " " in query:
-            new_query = query.split(" ", 1)[0].strip()
+
+        def lookup():
+            used = query
+            shortened = query.split(" ", 1)[0].strip() if " " in query else ""
+            if not shortened:
+                candidates = cached_vn_candidates(query, expected_date, expected_producer, limit)
+            else:
+                # Fire the fallback alongside the full query so a miss doesn't cost a second
+                # round-trip; don't wait for it when the full query already has results.
+                ex = ThreadPoolExecutor(max_workers=2)
+                try:
+                    full = ex.submit(cached_vn_candidates, query, expected_date, expected_producer, limit)
+                    short = ex.submit(cached_vn_candidates, shortened, expected_date, expected_producer, limit)
+                    candidates = full.result()
+                    if not candidates:
+                        used, candidates = shortened, short.result()
+                finally:
+                    ex.shutdown(wait=False)
+            return query, used, candidates
+
+        self._search_token += 1
+        self.search_button.setEnabled(False)
+        QThreadPool.globalInstance().start(ApiTask(self._search_token, lookup, self._search_signals))
+
+    def _on_search_failed(self, token: int, message: str):
+        if token != self._search_token:
+            return
+        self.search_button.setEnabled(True)
+        QMessageBox.warning(self, "Error", f"Error searching candidates: {message}")
+
+    def _on_candidates_ready(self, token: int, result):
+        if token != self._search_token:
+            return
+        self.search_button.setEnabled(True)
+        query, used, candidates = result
+        if used != query:
             QMessageBox.information(self, "Search Query",
-                                    f"No candidates found for '{query}'.\nTrying shortened query: '{new_query}'")
-            candidates = get_vn_candidates(new_query, expected_date, expected_producer, limit)
-        self.candidate_list.clear()
+                                    f"No candidates found for '{query}'.\nUsed shortened query: '{used}'")
+        # A single model reset: one relayout/repaint for the whole batch.
+        self.candidate_model.set_candidates(candidates or [])
         if not candidates:
             QMessageBox.information(self, "Candidates", "No VN candidates found.")
-            return
-        for cand in candidates:
-            item = QListWidgetItem()
-            tile = CandidateTile(cand, parent=self)
-            item.setSizeHint(tile.sizeHint())
-            item.setData(Qt.ItemDataRole.UserRole, cand)
-            self.candidate_list.addItem(item)
-            self.candidate_list.setItemWidget(item, tile)
-
-    def update_suggested_name(self):
+
+    def _flag_toggled(self, symbol: str, checked: bool):
+        if checked:
+            self._active_flags.add(symbol)
+        else:
+            self._active_flags.discard(symbol)
+        self.update_suggested_name()
+
+    def update_suggested_name(self, *_):
+        self._update_timer.start()
+
+    def _do_update_suggested_name(self):
+        self._update_timer.stop()
         if not hasattr(self, "vn_info") or self.vn_info is None:
             return
-        title_override = None
-        if self.use_jp_checkbox.isChecked():
-            jp = None
-            for t in self.vn_info.get("titles", []):
-                if t.get("main"):
-                    jp = t.get("title"); break
-            if not jp and self.vn_info.get("titles"):
-                jp = self.vn_info["titles"][0].get("title")
-            title_override = jp or self.vn_info.get("title", "")
-        flags = [s for s, cb in self.flag_checkboxes.items() if cb.isChecked()]
+        title_override = self.vn_info["_main_title"] if self.use_jp_checkbox.isChecked() else None
+        flags = [s for s in self.flag_checkboxes if s in self._active_flags]
         custom_template = self.template_editor.getTemplate()
         new_name = suggest_new_folder_name(
             self.vn_info, getattr(self, "release_info", None),
@@ -861,51 +1232,72 @@ class MainWindow(QMainWindow):
             custom_template=custom_template,
             title_override=title_override
         )
-        self.suggested_name_edit.setText(new_name)
-        self.template_preview.setText(custom_template)
-
-    def select_candidate(self, item: QListWidgetItem):
+        # setText on an unchanged QLineEdit would still reset its cursor and undo history.
+        if self.suggested_name_edit.text() != new_name:
+            self.suggested_name_edit.setText(new_name)
+        self._name_edited = False
+        if self.template_preview.text() != custom_template:
+            self.template_preview.setText(custom_template)
+
+    def select_candidate(self, index: QModelIndex):
         try:
-            cand = item.data(Qt.ItemDataRole.UserRole)
+            cand = index.data(Qt.ItemDataRole.UserRole)
             if not cand or not isinstance(cand, dict):
                 return
             self.vn_info = cand
-            vn_id = cand.get("id", "")
-            if vn_id and not str(vn_id).startswith("v"):
-                vn_id = "v" + str(vn_id)
-            self.vn_info["id"] = vn_id
+            if "_main_title" not in cand:
+                titles = cand.get("titles") or []
+                jp = next((t.get("title") for t in titles if t.get("main")), None)
+                if not jp and titles:
+                    jp = titles[0].get("title")
+                cand["_main_title"] = jp or cand.get("title", "")
+            vn_id = cand.get("id", "")  # already "v"-prefixed by get_vn_candidates
             # Try release lookup; if it fails, just keep None (no popup)
-            self.release_info = search_release(vn_id)
-            self.update_suggested_name()
+            self.release_info = None
+            self._release_token += 1
+            # The name shown until the reply lands lacks release data; don't let it be applied.
+            self.rename_button.setEnabled(False)
+            QThreadPool.globalInstance().start(
+                ApiTask(self._release_token, lambda: cached_release(vn_id), self._release_signals)
+            )
+            self._do_update_suggested_name()
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Error selecting candidate: {e}")
 
-    def open_candidate_detail(self, item: QListWidgetItem):
-        cand = item.data(Qt.ItemDataRole.UserRole)
+    def _on_release_ready(self, token: int, release):
+        # A folder switch or a new candidate bumps the token, so a matching
+        # token means the reply is for the candidate shown right now.
+        if token != self._release_token or self.vn_info is None:
+            return
+        self.release_info = release
+        self.rename_button.setEnabled(True)
+        # Keep whatever the user typed while the lookup was in flight.
+        if not self._name_edited:
+            self._do_update_suggested_name()
+
+    def _on_release_failed(self, token: int, message: str):
+        if token == self._release_token:
+            self.release_info = None
+            self.rename_button.setEnabled(True)
+
+    def open_candidate_detail(self, index: QModelIndex):
+        cand = index.data(Qt.ItemDataRole.UserRole)
         if not isinstance(cand, dict):
             return
 
-        # Works even if these widgets aren’t present yet
-        censor_enabled = bool(getattr(self, "censor_checkbox", None) and self.censor_checkbox.isChecked())
-        mode = normalize_censor_mode(self.censor_mode.currentText()) if getattr(self, "censor_mode", None) else "blur"
-
+        # The censor widgets are always built in __init__, before any candidate exists.
         dlg = CandidateDetailDialog(
             cand,
-            censor_enabled=self.censor_checkbox.isChecked() if hasattr(self, "censor_checkbox") else True,
-            censor_mode=mode,
+            censor_enabled=self.censor_checkbox.isChecked(),
+            censor_mode=normalize_censor_mode(self.censor_mode.currentText()),
             parent=self
         )
         dlg.exec()
 
     def refresh_candidate_tiles(self):
-        """Rebuild tile widgets to apply/clear censoring without new API calls."""
-        mode = normalize_censor_mode(self.censor_mode.currentText())
-        for i in range(self.candidate_list.count()):
-            item = self.candidate_list.item(i)
-            cand = item.data(Qt.ItemDataRole.UserRole)
-            tile = CandidateTile(cand, parent=self)
-            item.setSizeHint(tile.sizeHint())
-            self.candidate_list.setItemWidget(item, tile)
+        """Re-apply censoring to the listed covers without new API calls."""
+        self.candidate_model.set_censor(self.censor_checkbox.isChecked(),
+                                        normalize_censor_mode(self.censor_mode.currentText()))
 
     def rename_folder(self):
         new_name = self.suggested_name_edit.text().strip()
@@ -922,14 +1314,35 @@ class MainWindow(QMainWindow):
         old_path = os.path.join(self.directory, self.current_folder_name)
         new_path = os.path.join(self.directory, new_name)
         try:
-            os.rename(old_path, new_path)
+            # Never clobber another folder (os.replace would silently replace an empty
+            # one on POSIX); a case-only rename on a case-insensitive FS is the same entry.
+            if os.path.lexists(new_path) and not os.path.samefile(old_path, new_path):
+                raise FileExistsError(f"'{new_name}' already exists")
+            os.replace(old_path, new_path)
             QMessageBox.information(self, "Success", f"Folder renamed to:\n{new_name}")
-            self.refresh_folder_list()
+            self._rename_folder_item(self.current_folder_name, new_name)
             if self.shortcut_checkbox.isChecked():
                 create_vndb_shortcut(new_path, self.vn_info["id"])
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Error renaming folder: {e}")
 
+    def _rename_folder_item(self, old_name: str, new_name: str) -> None:
+        """Move the renamed folder's row to its sorted position instead of rescanning the directory."""
+        items = self.folder_list.findItems(old_name, Qt.MatchFlag.MatchExactly)
+        if not items:
+            self.refresh_folder_list()
+            return
+        item = self.folder_list.takeItem(self.folder_list.row(items[0]))
+        item.setText(new_name)
+        names = [self.folder_list.item(i).text() for i in range(self.folder_list.count())]
+        pos = bisect.bisect_left(names, new_name.casefold(), key=str.casefold)
+        self.folder_list.insertItem(pos, item)
+        self.folder_list.setCurrentItem(item)
+        self._folder_meta.pop(old_name, None)
+        self.current_folder_name = new_name
+        self.current_folder_path = os.path.join(self.directory, new_name)
+        self.original_value.setText(new_name)
+
 # -------------------- app --------------------
 class MainWindowApp(QMainWindow):
     def __init__(self):
@@ -940,6 +1353,7 @@ class MainWindowApp(QMainWindow):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(CENSOR_PIXMAP_CACHE_KB)
     app.setStyle("Fusion")
     f = app.font()
     f.setPointSize(f.pointSize() + 1)